@@ -9,6 +9,10 @@ import textwrap
 from io import StringIO
 
 
+# Shared wrapper used by `render` so we don't rebuild one for every paragraph.
+_TEXT_WRAPPER = textwrap.TextWrapper(width=80)
+
+
 class EnvInfos:
     """
     Customizing what information will be returned by an environment.
@@ -239,7 +243,7 @@ class Environment:
         # Wrap each paragraph.
         if mode == "human":
             paragraphs = msg.split("\n")
-            paragraphs = ["\n".join(textwrap.wrap(paragraph, width=80)) for paragraph in paragraphs]
+            paragraphs = ["\n".join(_TEXT_WRAPPER.wrap(paragraph)) for paragraph in paragraphs]
             msg = "\n".join(paragraphs)
 
         outfile.write(msg + "\n")
@@ -19,6 +19,9 @@ from textworld.core import GameNotRunningError
 
 GLULX_PATH = resource_filename(Requirement.parse('textworld'), 'textworld/thirdparty/glulx/Git-Glulx')
 
+# Shared wrapper used by `render` so we don't rebuild one for every paragraph.
+_TEXT_WRAPPER = textwrap.TextWrapper(width=80)
+
 
 def _strip_input_prompt_symbol(text: str) -> str:
     if text.endswith("\n>"):
@@ -46,6 +49,7 @@ class GitGlulxEnv(textworld.Environment):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._process = None
+        self._command_buffer = ffi.new('char[]', 1024)  # Reused by `_send`, grown as needed.
 
     def close(self) -> None:
         if self.game_running:
@@ -97,8 +101,13 @@ class GitGlulxEnv(textworld.Environment):
         if len(command) == 0:
             command = " "
 
-        c_command = ffi.new('char[]', command.encode('utf-8'))
-        result = lib.communicate(self._names_struct, c_command)
+        data = command.encode('utf-8')
+        if len(data) >= len(self._command_buffer):
+            self._command_buffer = ffi.new('char[]', 2 * (len(data) + 1))
+
+        ffi.memmove(self._command_buffer, data, len(data))
+        self._command_buffer[len(data)] = b'\0'
+        result = lib.communicate(self._names_struct, self._command_buffer)
         if result == ffi.NULL:
             self.close()
             return None
@@ -135,7 +144,7 @@ class GitGlulxEnv(textworld.Environment):
         # Wrap each paragraph.
         if mode == "human":
             paragraphs = msg.split("\n")
-            paragraphs = ["\n".join(textwrap.wrap(paragraph, width=80)) for paragraph in paragraphs]
+            paragraphs = ["\n".join(_TEXT_WRAPPER.wrap(paragraph)) for paragraph in paragraphs]
             msg = "\n".join(paragraphs)
 
         outfile.write(msg + "\n")
@@ -15,14 +15,42 @@ from textworld import testing
 
 from textworld import EnvInfos
 from textworld.envs import JerichoEnv, GitGlulxEnv
-from textworld.envs.wrappers.tw_inform7 import TWInform7
+from textworld.envs.wrappers.tw_inform7 import TWInform7, AVAILABLE_INFORM7_EXTRA_INFOS
 from textworld.envs.wrappers.tw_inform7 import GameData, Inform7Data
 from textworld.envs.wrappers.tw_inform7 import StateTracking
 from textworld.envs.wrappers.tw_inform7 import MissingGameInfosError
+from textworld.envs.wrappers.tw_inform7 import _detect_extra_infos, _detect_i7_events_debug_tags
 
 from textworld.utils import make_temp_directory
 
 
+def test_detect_i7_events_debug_tags():
+    text = ("[taking the apple]\nTaken.\n[taking the apple - succeeded]\n"
+            "[opening (something) - succeeded]\n[taking the apple - succeeded]\n")
+    events, cleaned = _detect_i7_events_debug_tags(text)
+    assert events == ["taking the apple", "taking the apple"]
+    assert cleaned == "Taken.\n"
+
+    events, cleaned = _detect_i7_events_debug_tags("No debug tags.")
+    assert events == []
+    assert cleaned == "No debug tags."
+
+
+def test_detect_extra_infos():
+    text = ("You eat the apple.\n"
+            "<inventory>\n[taking inventory]\nYou are carrying nothing.\n[taking inventory - succeeded]\n</inventory>"
+            "<score>\n1\n</score><moves>\n3\n</moves>\n")
+    matches, cleaned = _detect_extra_infos(text, ["inventory", "score"])
+    assert matches == {"inventory": "You are carrying nothing.", "score": "1"}
+    assert cleaned == "You eat the apple.\n<moves>\n3\n</moves>\n"
+
+    matches, cleaned = _detect_extra_infos("Nothing happens.")
+    assert matches == {tag: None for tag in AVAILABLE_INFORM7_EXTRA_INFOS}
+    assert cleaned == "Nothing happens."
+
+    npt.assert_raises(ValueError, _detect_extra_infos, text, ["unknown"])
+
+
 class TestInform7Data(unittest.TestCase):
 
     @classmethod
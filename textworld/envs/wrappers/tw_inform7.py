@@ -5,6 +5,7 @@
 # -*- coding: utf-8 -*-
 import os
 import re
+from functools import lru_cache
 
 from typing import Mapping, Tuple, List, Optional
 
@@ -16,6 +17,18 @@ from textworld.generator.inform7 import Inform7Game
 
 AVAILABLE_INFORM7_EXTRA_INFOS = ["description", "inventory", "score", "moves"]
 
+# Regexes used at every game step are compiled once.
+# Debug tags never span the separator used to clean several texts at once.
+_I7_DEBUG_TAG_REGEX = re.compile(r"\[[^]\x00]+\]\n?")
+_TEXT_SEPARATOR = "\x00"  # Can't appear in a game's output.
+
+
+@lru_cache(maxsize=32)
+def _get_extra_infos_regex(tags: Tuple[str, ...]):
+    """ Regex matching any of the given extra information tags in a single scan. """
+    regex = r"<(?P<tag>{tags})>\n(?P<body>.*)</(?P=tag)>".format(tags="|".join(map(re.escape, tags)))
+    return re.compile(regex, re.DOTALL)
+
 
 class MissingGameInfosError(NameError):
     """
@@ -50,14 +63,25 @@ def _detect_extra_infos(text: str, tracked_infos: Optional[List[str]] = None) ->
         if tag not in AVAILABLE_INFORM7_EXTRA_INFOS:
             raise ValueError("TW game doesn't support tag: {}".format(tag))
 
-        regex = re.compile(r"<{tag}>\n(.*)</{tag}>".format(tag=tag), re.DOTALL)
-        match = re.search(regex, text)
-        if match:
-            _, cleaned_text = _detect_i7_events_debug_tags(match.group(1))
+        matches[tag] = None
+
+    if "<" not in text:
+        return matches, text  # No tags, no need to run the regex.
+
+    # Extract and strip the tags in the same scan.
+    found = []
+
+    def _extract(match):
+        found.append((match.group("tag"), match.group("body")))
+        return ""
+
+    text = _get_extra_infos_regex(tuple(tracked_infos)).sub(_extract, text)
+    if found:
+        # Remove i7 debug tags from all the extra information in a single pass.
+        tags, bodies = zip(*found)
+        _, cleaned_bodies = _detect_i7_events_debug_tags(_TEXT_SEPARATOR.join(bodies))
+        for tag, cleaned_text in zip(tags, cleaned_bodies.split(_TEXT_SEPARATOR)):
             matches[tag] = cleaned_text.strip()
-            text = re.sub(regex, "", text)
-        else:
-            matches[tag] = None
 
     return matches, text
 
@@ -74,19 +98,21 @@ def _detect_i7_events_debug_tags(text: str) -> Tuple[List[str], str]:
         A tuple containing a list of Inform 7 events that were detected
         in the text, and a cleaned text without Inform 7 debug infos.
     """
+    if "[" not in text:
+        return [], text  # No tags, no need to run the regex.
+
     matches = []
-    for match in re.findall(r"\[[^]]+\]\n?", text):
-        text = text.replace(match, "")  # Remove i7 debug tags.
+    for match in _I7_DEBUG_TAG_REGEX.findall(text):
         tag_name = match.strip()[1:-1]  # Strip starting '[' and trailing ']'.
 
         if " - succeeded" in tag_name:
             tag_name = tag_name[:tag_name.index(" - succeeded")]
-            matches.append(tag_name)
-
-    # If it's got either a '(' or ')' in it, it's a subrule,
-    # so it doesn't count.
-    matches = [m for m in matches if "(" not in m and ")" not in m]
+            # If it's got either a '(' or ')' in it, it's a subrule,
+            # so it doesn't count.
+            if "(" not in tag_name and ")" not in tag_name:
+                matches.append(tag_name)
 
+    text = _I7_DEBUG_TAG_REGEX.sub("", text)  # Remove i7 debug tags.
     return matches, text
 
 
@@ -196,6 +222,8 @@ class StateTracking(textworld.core.Wrapper):
         self._current_winning_policy = None
         self._moves = None
         self._game_progression = None
+        self._admissible_commands_cache = None  # (valid_actions, admissible_commands)
+        self._policy_commands_cache = None  # (winning_policy, policy_commands)
 
     @property
     def tracking(self):
@@ -230,7 +258,12 @@ class StateTracking(textworld.core.Wrapper):
         if self.infos.policy_commands:
             self.state["policy_commands"] = []
             if self._current_winning_policy is not None:
-                self.state["policy_commands"] = self._inform7.gen_commands_from_actions(self._current_winning_policy)
+                # The winning policy is only recomputed when an action changes the game state.
+                winning_policy = self._current_winning_policy
+                if self._policy_commands_cache is None or self._policy_commands_cache[0] is not winning_policy:
+                    self._policy_commands_cache = (winning_policy, self._inform7.gen_commands_from_actions(winning_policy))
+
+                self.state["policy_commands"] = list(self._policy_commands_cache[1])
 
         if self.infos.intermediate_reward:
             self.state["intermediate_reward"] = 0
@@ -256,12 +289,18 @@ class StateTracking(textworld.core.Wrapper):
         if self.infos.last_action and self._last_action is not None:
             self.state["last_action"] = self._inform7.get_human_readable_action(self._last_action)
 
-        self.state["_valid_actions"] = self._game_progression.valid_actions
+        valid_actions = self._game_progression.valid_actions
+        self.state["_valid_actions"] = valid_actions
         if self.infos.admissible_commands:
-            all_valid_commands = self._inform7.gen_commands_from_actions(self._game_progression.valid_actions)
-            # To guarantee the order from one execution to another, we sort the commands.
-            # Remove any potential duplicate commands (they would lead to the same result anyway).
-            self.state["admissible_commands"] = sorted(set(all_valid_commands))
+            # GameProgression creates a new list of valid actions only when the game state changes,
+            # so the commands can be reused as long as we are given the same list.
+            if self._admissible_commands_cache is None or self._admissible_commands_cache[0] is not valid_actions:
+                all_valid_commands = self._inform7.gen_commands_from_actions(valid_actions)
+                # To guarantee the order from one execution to another, we sort the commands.
+                # Remove any potential duplicate commands (they would lead to the same result anyway).
+                self._admissible_commands_cache = (valid_actions, sorted(set(all_valid_commands)))
+
+            self.state["admissible_commands"] = list(self._admissible_commands_cache[1])
 
         if self.infos.moves:
             self.state["moves"] = self._moves
@@ -331,6 +370,7 @@ class StateTracking(textworld.core.Wrapper):
         if self._game_progression is not None:
             env._game_progression = self._game_progression.copy()
 
+        env._admissible_commands_cache = self._admissible_commands_cache  # Reference
         return env
 
 
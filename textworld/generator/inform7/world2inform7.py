@@ -60,6 +60,7 @@ class Inform7Game:
         self.entity_infos = self.game.infos
         self.kb = self.game.kb
         self.use_i7_description = False  # XXX: should it be removed?
+        self._commands_cache = {}  # Action -> text command
 
     def gen_source_for_map(self, src_room: WorldRoom) -> str:
         source = ""
@@ -196,20 +197,27 @@ class Inform7Game:
         mapping = self.kb.rules[action.name].match(action)
         return {ph.name: self.entity_infos[var.name].name for ph, var in mapping.items()}
 
+    def _gen_command_from_action(self, action: Action) -> str:
+        if getattr(action, "command_template"):
+            mapping = {var.name: self.entity_infos[var.name].name for var in action.variables}
+            return action.format_command(mapping)
+
+        msg = ("Using slower text commands from action generation."
+               " Regenerate your games, to get a faster version.")
+        warnings.warn(msg, TextworldInform7Warning)
+        command = self.kb.inform7_commands[action.name]
+        return command.format(**self._get_name_mapping(action))
+
     def gen_commands_from_actions(self, actions: Iterable[Action]) -> List[str]:
         commands = []
         for action in actions:
             command = "None"
             if action is not None:
-                if getattr(action, "command_template"):
-                    mapping = {var.name: self.entity_infos[var.name].name for var in action.variables}
-                    command = action.format_command(mapping)
-                else:
-                    msg = ("Using slower text commands from action generation."
-                           " Regenerate your games, to get a faster version.")
-                    warnings.warn(msg, TextworldInform7Warning)
-                    command = self.kb.inform7_commands[action.name]
-                    command = command.format(**self._get_name_mapping(action))
+                # The text command of an action only depends on the game, not on its current state.
+                command = self._commands_cache.get(action)
+                if command is None:
+                    command = self._gen_command_from_action(action)
+                    self._commands_cache[action] = command
 
             commands.append(command)
 
@@ -21,6 +21,14 @@ from textworld.gym.envs.utils import shuffled_cycle
 from functools import partial
 
 
+# Shared wrapper used by `render` so we don't rebuild one for every paragraph.
+_TEXT_WRAPPER = textwrap.TextWrapper(width=80)
+
+# ANSI codes surrounding a command in `render`, computed once instead of calling
+# `colorize` for every environment at every step.
+_COMMAND_PREFIX, _, _COMMAND_SUFFIX = colorize("|", "yellow", highlight=False).partition("|")
+
+
 def _make_env(request_infos, max_episode_steps=None):
     env = GenericEnvironment(request_infos)
     if max_episode_steps:
@@ -197,14 +205,14 @@ class TextworldBatchGymEnv(gym.Env):
             if last_command is not None:
                 command = "> " + last_command
                 if mode in ["ansi", "human"]:
-                    command = colorize(command, "yellow", highlight=False)
+                    command = _COMMAND_PREFIX + command + _COMMAND_SUFFIX
 
                 msg = command + "\n" + msg
 
             if mode == "human":
                 # Wrap each paragraph at 80 characters.
                 paragraphs = msg.split("\n")
-                paragraphs = ["\n".join(textwrap.wrap(paragraph, width=80)) for paragraph in paragraphs]
+                paragraphs = ["\n".join(_TEXT_WRAPPER.wrap(paragraph)) for paragraph in paragraphs]
                 msg = "\n".join(paragraphs)
 
             renderings.append(msg)